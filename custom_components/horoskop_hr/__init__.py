@@ -7,9 +7,12 @@ import homeassistant.helpers.config_validation as cv
 import voluptuous as vol
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.helpers.dispatcher import async_dispatcher_send
 
-from .const import DOMAIN, PLATFORMS
+from .const import DOMAIN, PLATFORMS, SIGNAL_ENTRY_UNLOADED
 from .coordinator import HoroskopDataCoordinator, HoroskopTranslationCoordinator
+from .tts_cache import HoroskopTtsView
+from .websocket_api import async_register_websocket_commands
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -48,6 +51,8 @@ async def async_setup(hass: HomeAssistant, config: dict) -> bool:
 
     hass.services.async_register(DOMAIN, SERVICE_REFRESH, handle_refresh, schema=SERVICE_SCHEMA)
     hass.services.async_register(DOMAIN, SERVICE_TRANSLATE, handle_translate, schema=SERVICE_SCHEMA)
+    async_register_websocket_commands(hass)
+    hass.http.register_view(HoroskopTtsView(hass))
     return True
 
 
@@ -71,6 +76,8 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    if unload_ok:
+        async_dispatcher_send(hass, SIGNAL_ENTRY_UNLOADED.format(entry.entry_id))
     entry_data = hass.data.get(DOMAIN, {}).pop(entry.entry_id, None)
     if entry_data:
         data_coordinator, _ = entry_data
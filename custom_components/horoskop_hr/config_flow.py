@@ -7,10 +7,16 @@ from homeassistant.core import callback
 from homeassistant.helpers import selector
 
 from .const import (
+    DEFAULT_MAX_PAGE_KB,
+    DEFAULT_PARSE_TIMEOUT,
     DEFAULT_SCHEDULED_TIMES,
     DEFAULT_TRANSLATION_AI_TASK_ENTITY,
     DEFAULT_TRANSLATION_ENABLED,
     DEFAULT_TRANSLATION_LANGUAGE,
+    DEFAULT_TTS_CACHE_MB,
+    DEFAULT_TTS_CACHE_SIZE,
+    DEFAULT_TTS_ENTITY,
+    DEFAULT_TTS_PRERENDER_ENABLED,
     DEFAULT_UPDATE_INTERVAL,
     DEFAULT_USE_SCHEDULED_REFRESH,
     DOMAIN,
@@ -37,6 +43,12 @@ class HoroskopHrConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 "translation_enabled": DEFAULT_TRANSLATION_ENABLED,
                 "translation_language": DEFAULT_TRANSLATION_LANGUAGE,
                 "translation_ai_task_entity": DEFAULT_TRANSLATION_AI_TASK_ENTITY,
+                "tts_prerender_enabled": DEFAULT_TTS_PRERENDER_ENABLED,
+                "tts_entity": DEFAULT_TTS_ENTITY,
+                "tts_cache_size": DEFAULT_TTS_CACHE_SIZE,
+                "tts_cache_mb": DEFAULT_TTS_CACHE_MB,
+                "max_page_kb": DEFAULT_MAX_PAGE_KB,
+                "parse_timeout": DEFAULT_PARSE_TIMEOUT,
             },
         )
 
@@ -79,6 +91,27 @@ class HoroskopHrOptionsFlow(config_entries.OptionsFlowWithReload):
                     "translation_ai_task_entity",
                     default=opt.get("translation_ai_task_entity", DEFAULT_TRANSLATION_AI_TASK_ENTITY),
                 ): selector.EntitySelector(selector.EntitySelectorConfig(domain="ai_task")),
+                vol.Required(
+                    "tts_prerender_enabled",
+                    default=opt.get("tts_prerender_enabled", DEFAULT_TTS_PRERENDER_ENABLED),
+                ): bool,
+                vol.Optional(
+                    "tts_entity",
+                    default=opt.get("tts_entity", DEFAULT_TTS_ENTITY),
+                ): selector.EntitySelector(selector.EntitySelectorConfig(domain="tts")),
+                vol.Required(
+                    "tts_cache_size",
+                    default=opt.get("tts_cache_size", DEFAULT_TTS_CACHE_SIZE),
+                ): vol.All(vol.Coerce(int), vol.Range(min=24, max=500)),
+                vol.Required("tts_cache_mb", default=opt.get("tts_cache_mb", DEFAULT_TTS_CACHE_MB)): vol.All(
+                    vol.Coerce(int), vol.Range(min=4, max=512)
+                ),
+                vol.Required("max_page_kb", default=opt.get("max_page_kb", DEFAULT_MAX_PAGE_KB)): vol.All(
+                    vol.Coerce(int), vol.Range(min=256, max=16384)
+                ),
+                vol.Required("parse_timeout", default=opt.get("parse_timeout", DEFAULT_PARSE_TIMEOUT)): vol.All(
+                    vol.Coerce(int), vol.Range(min=1, max=60)
+                ),
             }
         )
         return self.async_show_form(step_id="init", data_schema=schema)
@@ -1,5 +1,13 @@
 """Constants for Horoskop HR."""
 
+from .horoskop_core.const import (  # noqa: F401
+    BASE_URL,
+    DEFAULT_MAX_PAGE_KB,
+    DEFAULT_PARSE_TIMEOUT,
+    SIGNS,
+    SOURCE_LANGUAGE,
+)
+
 DOMAIN = "horoskop_hr"
 PLATFORMS = ["sensor"]
 
@@ -9,23 +17,14 @@ DEFAULT_SCHEDULED_TIMES = "00:00,08:00"
 DEFAULT_TRANSLATION_ENABLED = False
 DEFAULT_TRANSLATION_LANGUAGE = "en"
 DEFAULT_TRANSLATION_AI_TASK_ENTITY = None
+DEFAULT_TTS_PRERENDER_ENABLED = False
+DEFAULT_TTS_ENTITY = None
+DEFAULT_TTS_CACHE_SIZE = 48
+DEFAULT_TTS_CACHE_MB = 64
 
-BASE_URL = "https://ehoroskop.net"
+PERIODS = ["dnevni", "tjedni", "mjesecni"]
 
-SIGNS: dict[str, str] = {
-    "ovan": "Ovan",
-    "bik": "Bik",
-    "blizanci": "Blizanci",
-    "rak": "Rak",
-    "lav": "Lav",
-    "djevica": "Djevica",
-    "vaga": "Vaga",
-    "skorpion": "Skorpion",
-    "strijelac": "Strijelac",
-    "jarac": "Jarac",
-    "vodenjak": "Vodenjak",
-    "ribe": "Ribe",
-}
+SIGNAL_ENTRY_UNLOADED = f"{DOMAIN}_unloaded_{{}}"
 
 ATTR_ATTRIBUTION = "attribution"
 ATTR_SOURCE_URLS = "source_urls"
@@ -2,10 +2,8 @@
 from __future__ import annotations
 
 import asyncio
-import html as html_lib
 import json
 import logging
-import re
 from datetime import timedelta
 from typing import Any
 
@@ -20,183 +18,32 @@ from .const import (
     ATTR_ATTRIBUTION,
     ATTR_SOURCE_URLS,
     BASE_URL,
+    DEFAULT_MAX_PAGE_KB,
+    DEFAULT_PARSE_TIMEOUT,
     DEFAULT_SCHEDULED_TIMES,
     DEFAULT_TRANSLATION_ENABLED,
     DEFAULT_TRANSLATION_LANGUAGE,
+    DEFAULT_TTS_CACHE_MB,
+    DEFAULT_TTS_CACHE_SIZE,
+    DEFAULT_TTS_ENTITY,
+    DEFAULT_TTS_PRERENDER_ENABLED,
     DEFAULT_UPDATE_INTERVAL,
     DEFAULT_USE_SCHEDULED_REFRESH,
     DOMAIN,
     SIGNS,
 )
+from .horoskop_core.parser import format_daily, format_monthly, format_weekly, parse_page
+from .horoskop_core.translation import (
+    build_translation_prompt,
+    estimate_tokens,
+    rebuild_translated,
+    translation_units,
+)
+from .tts_cache import HoroskopTtsCache
 
 _LOGGER = logging.getLogger(__name__)
 
 
-def _try_demojibake(text: str) -> str:
-    """Best-effort recovery when UTF-8 was decoded with a legacy codepage."""
-    candidates = [text]
-    for src in ("latin-1", "cp1252", "cp1250"):
-        try:
-            candidates.append(text.encode(src).decode("utf-8"))
-        except Exception:  # noqa: BLE001
-            continue
-
-    def _score(value: str) -> int:
-        good = sum(value.count(ch) for ch in "čćžšđČĆŽŠĐ")
-        bad = value.count("Ã") + value.count("Ä") + value.count("Å") + value.count("Ĺ") + value.count("�")
-        return (good * 3) - (bad * 4)
-
-    return max(candidates, key=_score)
-
-
-def _normalize_match_text(text: str) -> str:
-    """Normalize text for tolerant section-title matching."""
-    value = _try_demojibake(_strip_tags(text)).lower()
-    value = value.replace("č", "c").replace("ć", "c").replace("ž", "z").replace("š", "s").replace("đ", "d")
-    value = re.sub(r"\s+", " ", value).strip()
-    return value
-
-
-def _strip_tags(text: str) -> str:
-    """Convert HTML to plain text with stable spacing."""
-    value = re.sub(r"(?i)<br\s*/?>", "\n", text)
-    value = re.sub(r"<[^>]+>", "", value)
-    value = html_lib.unescape(value)
-    lines = [re.sub(r"\s+", " ", line).strip() for line in value.splitlines()]
-    cleaned = "\n".join([line for line in lines if line]).strip()
-    repaired = _try_demojibake(cleaned)
-    # Drop residual C1 controls that sometimes appear in mojibake payloads.
-    repaired = re.sub(r"[\u0080-\u009f]", "", repaired)
-    return repaired
-
-
-def _extract_section(html: str, keyword: str) -> tuple[str | None, str]:
-    """Extract date and text payload for one section."""
-    wanted = _normalize_match_text(keyword)
-
-    def _title_matches(title_norm: str) -> bool:
-        if "mjesec" in wanted or "mjesec" in wanted or "mjese" in wanted:
-            return ("horoskop" in title_norm) and (
-                "mjesec" in title_norm or "mjesec" in title_norm or "mjese" in title_norm
-            )
-        if "tjedn" in wanted:
-            return ("horoskop" in title_norm) and ("tjedn" in title_norm)
-        if "dnevn" in wanted:
-            return ("horoskop" in title_norm) and ("dnevn" in title_norm)
-        return wanted in title_norm
-
-    h3_match = None
-    for match in re.finditer(r"<h3[^>]*>(.*?)</h3>", html, re.IGNORECASE | re.DOTALL):
-        title_norm = _normalize_match_text(match.group(1))
-        if _title_matches(title_norm):
-            h3_match = match
-            break
-
-    if h3_match is None:
-        return None, ""
-    start = h3_match.end()
-    next_h3 = re.search(r"<h3[^>]*>", html[start:], re.IGNORECASE)
-    chunk = html[start : start + next_h3.start()] if next_h3 else html[start:]
-
-    date_match = re.search(r'<div[^>]*class="[^"]*datum[^"]*"[^>]*>\s*(.*?)\s*</div>', chunk, re.IGNORECASE | re.DOTALL)
-    raw_date = _strip_tags(date_match.group(1)) if date_match else None
-
-    text_match = re.search(r"<p[^>]*>(.*?)</p>", chunk, re.IGNORECASE | re.DOTALL)
-    raw_text = _strip_tags(text_match.group(1)) if text_match else ""
-    return raw_date, raw_text
-
-
-def _normalize_category(label: str) -> str | None:
-    normalized = _strip_tags(label).upper().replace("&", "").replace(" ", "")
-    if "LJUBAV" in normalized:
-        return "ljubav"
-    if "KARIJERA" in normalized or "POSAO" in normalized:
-        return "posao"
-    if "ZDRAVLJE" in normalized:
-        return "zdravlje"
-    return None
-
-
-def _extract_weekly_scores(chunk: str) -> dict[str, int]:
-    """Extract weekly star scores from image URLs."""
-    scores: dict[str, int] = {}
-    pattern = re.compile(
-        r'<div[^>]*class="[^"]*zvijezda-text[^"]*"[^>]*>\s*([^:]+):\s*</div>\s*'
-        r'<img[^>]+src="[^"]*zvijezde-(\d+)-5\.png"',
-        re.IGNORECASE | re.DOTALL,
-    )
-    for label, score_str in pattern.findall(chunk):
-        key = _normalize_category(label)
-        if not key:
-            continue
-        try:
-            scores[key] = max(1, min(5, int(score_str)))
-        except ValueError:
-            continue
-    return scores
-
-
-def _extract_weekly_split(text: str) -> dict[str, str]:
-    """Split weekly text into category paragraphs."""
-    sections: dict[str, str] = {}
-    pattern = re.compile(
-        r"(LJUBAV|KARIJERA|ZDRAVLJE(?:&SAVJET)?):\s*(.*?)(?=(?:LJUBAV|KARIJERA|ZDRAVLJE(?:&SAVJET)?):|$)",
-        re.IGNORECASE | re.DOTALL,
-    )
-    for label, payload in pattern.findall(text):
-        key = _normalize_category(label)
-        if key:
-            sections[key] = re.sub(r"\s+", " ", payload).strip()
-    return sections
-
-
-def _format_daily(sign_name: str, payload: dict[str, Any]) -> str:
-    return f"{sign_name} ({payload.get('datum', '-')})\n{payload.get('tekst', '')}".strip()
-
-
-def _format_weekly(sign_name: str, payload: dict[str, Any]) -> str:
-    categories = payload.get("kategorija", {})
-    parts = [f"{sign_name} ({payload.get('datum_od_do', '-')})"]
-    for key in ("ljubav", "posao", "zdravlje"):
-        entry = categories.get(key, {})
-        score = entry.get("score")
-        text = entry.get("tekst", "")
-        parts.append(f"{key.upper()} [{score if score is not None else '-'} / 5]: {text}")
-    return "\n".join(parts).strip()
-
-
-def _format_monthly(sign_name: str, payload: dict[str, Any]) -> str:
-    return f"{sign_name} ({payload.get('mjesec', '-')})\n{payload.get('tekst', '')}".strip()
-
-
-def _decode_html(raw: bytes, declared_charset: str | None) -> str:
-    """Decode HTML with robust fallback for Balkan encodings."""
-    # Some pages are served with misleading charset headers.
-    candidates = ["utf-8"]
-    if declared_charset and declared_charset.lower() != "utf-8":
-        candidates.append(declared_charset)
-    candidates.extend(["cp1250", "iso-8859-2", "latin-1"])
-
-    decoded: list[str] = []
-    for charset in candidates:
-        try:
-            decoded.append(raw.decode(charset))
-        except (LookupError, UnicodeDecodeError):
-            continue
-
-    if decoded:
-        def _score(text: str) -> int:
-            # Prefer strings with valid HR diacritics; penalize mojibake artifacts.
-            good = sum(text.count(ch) for ch in "čćžšđČĆŽŠĐ")
-            c1 = sum(1 for ch in text if 0x80 <= ord(ch) <= 0x9F)
-            bad = text.count("Ã") + text.count("Ä") + text.count("Å") + text.count("Ĺ") + text.count("�") + c1
-            return (good * 3) - (bad * 4)
-
-        return max(decoded, key=_score)
-
-    return raw.decode("utf-8", errors="replace")
-
-
 def _parse_scheduled_times(raw: str) -> list[tuple[int, int]]:
     """Parse 'HH:MM,HH:MM' into a list of (hour, minute)."""
     out: list[tuple[int, int]] = []
@@ -223,6 +70,14 @@ class HoroskopDataCoordinator(DataUpdateCoordinator):
         self.entry = entry
         self.translation_coordinator: HoroskopTranslationCoordinator | None = None
         self._unsub_schedule: list[Any] = []
+        self.tts_cache: HoroskopTtsCache | None = None
+        if entry.options.get("tts_prerender_enabled", DEFAULT_TTS_PRERENDER_ENABLED):
+            self.tts_cache = HoroskopTtsCache(
+                hass,
+                entry.options.get("tts_entity", DEFAULT_TTS_ENTITY),
+                int(entry.options.get("tts_cache_size", DEFAULT_TTS_CACHE_SIZE)),
+                int(entry.options.get("tts_cache_mb", DEFAULT_TTS_CACHE_MB)) * 1024 * 1024,
+            )
         use_schedule = bool(entry.options.get("use_scheduled_refresh", DEFAULT_USE_SCHEDULED_REFRESH))
         interval = int(entry.options.get("update_interval", DEFAULT_UPDATE_INTERVAL))
         super().__init__(
@@ -262,47 +117,53 @@ class HoroskopDataCoordinator(DataUpdateCoordinator):
         """Refresh when scheduled time hits."""
         await self.async_request_refresh()
 
+    def translation_language(self) -> str:
+        """Return the configured translation target language."""
+        return str(self.entry.options.get("translation_language", DEFAULT_TRANSLATION_LANGUAGE))
+
+    def _translated_language(self, data: dict[str, Any]) -> str | None:
+        if not data.get("dnevni_translated"):
+            return None
+        return self.translation_language()
+
+    def tts_lookup(self, data: dict[str, Any]) -> dict[str, dict[str, str]] | None:
+        """Return cached TTS media URLs for the daily texts in data."""
+        if not self.tts_cache:
+            return None
+        return self.tts_cache.lookup(data, self._translated_language(data))
+
+    async def async_prerender_tts(self, data: dict[str, Any]) -> None:
+        """Synthesize daily texts missing from the TTS cache and publish their URLs."""
+        if not self.tts_cache:
+            return
+        await self.tts_cache.async_prerender(data, self._translated_language(data))
+        # Publish against the latest data; translation may have landed meanwhile.
+        current = dict(self.data or {})
+        rendered = self.tts_lookup(current)
+        if current.get("dnevni_tts") == rendered:
+            return
+        current["dnevni_tts"] = rendered
+        self.async_set_updated_data(current)
+
     async def _fetch_sign(self, slug: str, sign_name: str) -> dict[str, Any]:
         url = f"{BASE_URL}/{slug}/"
+        max_bytes = int(self.entry.options.get("max_page_kb", DEFAULT_MAX_PAGE_KB)) * 1024
+        parse_timeout = float(self.entry.options.get("parse_timeout", DEFAULT_PARSE_TIMEOUT))
         session = async_get_clientsession(self.hass)
         async with session.get(url, timeout=30) as response:
             response.raise_for_status()
-            raw = await response.read()
-            html = _decode_html(raw, response.charset)
-
-        daily_date, daily_text = _extract_section(html, "Dnevni horoskop")
-        weekly_date, weekly_text = _extract_section(html, "Tjedni horoskop")
-        monthly_date, monthly_text = _extract_section(html, "Mjesečni horoskop")
-        if not monthly_text:
-            # Fallback for occasional unaccented heading variants.
-            monthly_date, monthly_text = _extract_section(html, "Mjesecni horoskop")
-
-        weekly_h3 = re.search(r"<h3[^>]*>.*?-\s*Tjedni horoskop\s*</h3>", html, re.IGNORECASE | re.DOTALL)
-        weekly_chunk = ""
-        if weekly_h3:
-            next_h3 = re.search(r"<h3[^>]*>", html[weekly_h3.end() :], re.IGNORECASE)
-            weekly_chunk = (
-                html[weekly_h3.end() : weekly_h3.end() + next_h3.start()]
-                if next_h3
-                else html[weekly_h3.end() :]
-            )
-
-        scores = _extract_weekly_scores(weekly_chunk)
-        weekly_split = _extract_weekly_split(weekly_text)
-        categories = {
-            "ljubav": {"score": scores.get("ljubav"), "tekst": weekly_split.get("ljubav", "")},
-            "posao": {"score": scores.get("posao"), "tekst": weekly_split.get("posao", "")},
-            "zdravlje": {"score": scores.get("zdravlje"), "tekst": weekly_split.get("zdravlje", "")},
-        }
-
-        return {
-            "slug": slug,
-            "znak": sign_name,
-            "url": url,
-            "dnevni": {"datum": daily_date, "tekst": daily_text},
-            "tjedni": {"datum_od_do": weekly_date, "kategorija": categories},
-            "mjesecni": {"mjesec": monthly_date, "tekst": monthly_text},
-        }
+            if response.content_length is not None and response.content_length > max_bytes:
+                raise RuntimeError(f"Page {url} exceeds {max_bytes} bytes.")
+            raw = bytearray()
+            async for block in response.content.iter_chunked(65536):
+                raw.extend(block)
+                if len(raw) > max_bytes:
+                    raise RuntimeError(f"Page {url} exceeds {max_bytes} bytes.")
+            charset = response.charset
+
+        # Decoding and parsing are CPU-bound; keep them off the event loop.
+        parsed = await self.hass.async_add_executor_job(parse_page, bytes(raw), charset, parse_timeout)
+        return {"slug": slug, "znak": sign_name, "url": url, **parsed}
 
     async def _async_update_data(self) -> dict[str, Any]:
         try:
@@ -326,9 +187,9 @@ class HoroskopDataCoordinator(DataUpdateCoordinator):
                 tjedni_raw[slug] = {"znak": sign_name, "url": item["url"], **item["tjedni"]}
                 mjesecni_raw[slug] = {"znak": sign_name, "url": item["url"], **item["mjesecni"]}
 
-                dnevni_formatted[slug] = _format_daily(sign_name, dnevni_raw[slug])
-                tjedni_formatted[slug] = _format_weekly(sign_name, tjedni_raw[slug])
-                mjesecni_formatted[slug] = _format_monthly(sign_name, mjesecni_raw[slug])
+                dnevni_formatted[slug] = format_daily(sign_name, dnevni_raw[slug])
+                tjedni_formatted[slug] = format_weekly(sign_name, tjedni_raw[slug])
+                mjesecni_formatted[slug] = format_monthly(sign_name, mjesecni_raw[slug])
 
             data = {
                 "generated_at": dt_util.now().isoformat(),
@@ -344,7 +205,10 @@ class HoroskopDataCoordinator(DataUpdateCoordinator):
                 "tjedni_translated": None,
                 "mjesecni_translated": None,
             }
+            data["dnevni_tts"] = self.tts_lookup(data)
 
+            if self.tts_cache:
+                self.hass.async_create_task(self.async_prerender_tts(data))
             if self.entry.options.get("translation_enabled", DEFAULT_TRANSLATION_ENABLED) and self.translation_coordinator:
                 self.hass.async_create_task(self.translation_coordinator.async_translate(data))
 
@@ -398,8 +262,11 @@ class HoroskopTranslationCoordinator(DataUpdateCoordinator):
             merged["dnevni_translated"] = translated.get("dnevni", {})
             merged["tjedni_translated"] = translated.get("tjedni", {})
             merged["mjesecni_translated"] = translated.get("mjesecni", {})
+            merged["dnevni_tts"] = self.data_coordinator.tts_lookup(merged)
 
             self.data_coordinator.async_set_updated_data(merged)
+            if self.data_coordinator.tts_cache:
+                self.hass.async_create_task(self.data_coordinator.async_prerender_tts(merged))
             self._state.update(
                 {
                     "status": "done",
@@ -420,18 +287,16 @@ class HoroskopTranslationCoordinator(DataUpdateCoordinator):
             raise RuntimeError("No ai_task service available.")
 
         ai_service = "generate_data" if has_generate_data else "generate_text"
-        compact_source = {
-            "dnevni": source.get("dnevni_formatted", {}),
-            "tjedni": source.get("tjedni_formatted", {}),
-            "mjesecni": source.get("mjesecni_formatted", {}),
-        }
-
-        prompt = (
-            f"Translate the following horoscope texts to language code '{language}'.\n"
-            "Return strictly valid JSON only. Keep original keys and structure exactly:\n"
-            "{'dnevni': {'slug': 'text'}, 'tjedni': {'slug': 'text'}, 'mjesecni': {'slug': 'text'}}.\n"
-            "Do not add markdown, comments, or extra keys.\n\n"
-            f"INPUT_JSON:\n{json.dumps(compact_source, ensure_ascii=False)}"
+        units = translation_units(source)
+        if not units:
+            raise RuntimeError("No translatable text in source data.")
+
+        prompt = build_translation_prompt(units, language)
+        _LOGGER.debug(
+            "Horoskop translation prompt: %d units, %d chars, ~%d tokens",
+            len(units),
+            len(prompt),
+            estimate_tokens(prompt),
         )
 
         service_data: dict[str, Any] = {"task_name": f"{DOMAIN}_translate", "instructions": prompt}
@@ -449,12 +314,7 @@ class HoroskopTranslationCoordinator(DataUpdateCoordinator):
         if not raw:
             raise RuntimeError(f"Empty translation response: {resp!r}")
         parsed = self._parse_json(raw)
-
-        return {
-            "dnevni": parsed.get("dnevni", {}),
-            "tjedni": parsed.get("tjedni", {}),
-            "mjesecni": parsed.get("mjesecni", {}),
-        }
+        return rebuild_translated(source, parsed)
 
     @staticmethod
     def _extract_text(resp: Any) -> str:
@@ -0,0 +1,23 @@
+"""Home Assistant independent fetch and parse core for Horoskop HR."""
+from __future__ import annotations
+
+from .audio_cache import AudioCache
+from .fetch import fetch_sign, fetch_signs, parse_directory, parse_file
+from .parser import decode_html, extract_section, extract_weekly_scores, extract_weekly_split, parse_page
+from .translation import build_translation_prompt, rebuild_translated, translation_units
+
+__all__ = [
+    "AudioCache",
+    "build_translation_prompt",
+    "decode_html",
+    "extract_section",
+    "extract_weekly_scores",
+    "extract_weekly_split",
+    "fetch_sign",
+    "fetch_signs",
+    "parse_directory",
+    "parse_file",
+    "parse_page",
+    "rebuild_translated",
+    "translation_units",
+]
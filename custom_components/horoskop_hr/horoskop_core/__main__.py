@@ -0,0 +1,95 @@
+"""Command line entry point: python -m horoskop_core."""
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Any
+
+from .const import DEFAULT_CONCURRENCY, DEFAULT_MAX_PAGE_KB, DEFAULT_PARSE_TIMEOUT, SIGNS
+from .fetch import fetch_signs, parse_directory
+from .parser import format_daily, format_monthly, format_weekly
+
+
+def _with_formatted(record: dict[str, Any]) -> dict[str, Any]:
+    if "error" in record:
+        return record
+    sign_name = record.get("znak", record["slug"])
+    record["formatted"] = {
+        "dnevni": format_daily(sign_name, record["dnevni"]),
+        "tjedni": format_weekly(sign_name, record["tjedni"]),
+        "mjesecni": format_monthly(sign_name, record["mjesecni"]),
+    }
+    return record
+
+
+def _parse_signs(raw: str) -> list[str]:
+    slugs = [part.strip() for part in raw.split(",") if part.strip()]
+    unknown = [slug for slug in slugs if slug not in SIGNS]
+    if unknown:
+        raise argparse.ArgumentTypeError(f"unknown signs: {', '.join(unknown)}")
+    return slugs
+
+
+def _positive_int(raw: str) -> int:
+    try:
+        value = int(raw)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {raw!r}") from None
+    if value < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return value
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="horoskop_core", description="Fetch or parse ehoroskop.net pages as JSON lines.")
+    parser.add_argument("--parse-timeout", type=float, default=DEFAULT_PARSE_TIMEOUT, help="per-page parse deadline in seconds")
+    parser.add_argument("--formatted", action="store_true", help="include formatted text blocks")
+    sub = parser.add_subparsers(dest="command", required=True)
+    limits = argparse.ArgumentParser(add_help=False)
+    limits.add_argument("--max-page-kb", type=_positive_int, default=DEFAULT_MAX_PAGE_KB, help="reject larger pages")
+
+    fetch = sub.add_parser("fetch", parents=[limits], help="fetch signs from ehoroskop.net")
+    fetch.add_argument("--signs", type=_parse_signs, default=list(SIGNS), help="comma-separated slugs (default: all)")
+    fetch.add_argument("--concurrency", type=_positive_int, default=DEFAULT_CONCURRENCY, help="max parallel requests")
+
+    parse = sub.add_parser("parse", parents=[limits], help="parse saved <slug>.html files")
+    parse.add_argument("directory")
+    parse.add_argument("--workers", type=_positive_int, default=None, help="worker processes (default: CPU count)")
+    parse.add_argument("--pattern", default="*.html", help="file glob inside directory")
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = _build_parser()
+    args = parser.parse_args(argv)
+    if args.command == "fetch":
+        records = fetch_signs(
+            args.signs,
+            concurrency=args.concurrency,
+            max_page_kb=args.max_page_kb,
+            parse_timeout=args.parse_timeout,
+        )
+    else:
+        if not Path(args.directory).is_dir():
+            parser.error(f"not a directory: {args.directory}")
+        records = parse_directory(args.directory, args.workers, args.parse_timeout, args.pattern, args.max_page_kb)
+
+    failed = False
+    count = 0
+    for record in records:
+        count += 1
+        failed = failed or "error" in record
+        if args.formatted:
+            record = _with_formatted(record)
+        sys.stdout.write(json.dumps(record, ensure_ascii=False) + "\n")
+    if not count:
+        source = f"{args.directory}/{args.pattern}" if args.command == "parse" else "fetch"
+        sys.stderr.write(f"horoskop_core: warning: no records produced ({source})\n")
+        return 1
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,121 @@
+"""Bounded LRU store for pre-rendered announcement audio.
+
+This module has no Home Assistant dependencies; synthesis is injected.
+"""
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+import mimetypes
+import secrets
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from .const import SOURCE_LANGUAGE
+
+_LOGGER = logging.getLogger(__name__)
+
+Synthesizer = Callable[[str, str], Awaitable[tuple[str, bytes]]]
+
+
+def cache_key(text: str, language: str) -> tuple[str, str]:
+    """Key cached audio by content hash and language."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest(), language
+
+
+def daily_texts(data: dict[str, Any], translated_language: str | None) -> list[tuple[str, str, str]]:
+    """Collect (slug, language, text) for every daily text worth announcing."""
+    out: list[tuple[str, str, str]] = []
+    for slug, text in (data.get("dnevni_formatted") or {}).items():
+        if isinstance(text, str) and text:
+            out.append((slug, SOURCE_LANGUAGE, text))
+    # A translation into the source language would shadow the source clip.
+    if translated_language and translated_language != SOURCE_LANGUAGE:
+        for slug, text in (data.get("dnevni_translated") or {}).items():
+            if isinstance(text, str) and text:
+                out.append((slug, translated_language, text))
+    return out
+
+
+class AudioCache:
+    """LRU audio store bounded by entry count and total bytes."""
+
+    def __init__(self, synthesize: Synthesizer, max_entries: int, max_bytes: int, url_prefix: str) -> None:
+        self._synthesize = synthesize
+        self._max_entries = max(1, int(max_entries))
+        self._max_bytes = max(1, int(max_bytes))
+        self._url_prefix = url_prefix
+        # key -> (token, extension, audio)
+        self._entries: OrderedDict[tuple[str, str], tuple[str, str, bytes]] = OrderedDict()
+        self._tokens: dict[str, tuple[str, str]] = {}
+        self._bytes = 0
+        self._lock = asyncio.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def total_bytes(self) -> int:
+        return self._bytes
+
+    def lookup(self, data: dict[str, Any], translated_language: str | None) -> dict[str, dict[str, str]]:
+        """Return already rendered media URLs per sign and language."""
+        out: dict[str, dict[str, str]] = {}
+        for slug, language, text in daily_texts(data, translated_language):
+            key = cache_key(text, language)
+            entry = self._entries.get(key)
+            if entry is None:
+                continue
+            self._entries.move_to_end(key)
+            token, extension, _audio = entry
+            out.setdefault(slug, {})[language] = f"{self._url_prefix}/{token}.{extension}"
+        return out
+
+    def get_audio(self, filename: str) -> tuple[str, bytes] | None:
+        """Return (content_type, audio) for a served `<token>.<ext>` filename."""
+        key = self._tokens.get(filename.split(".", 1)[0])
+        if key is None:
+            return None
+        self._entries.move_to_end(key)
+        _token, extension, audio = self._entries[key]
+        return mimetypes.guess_type(f"audio.{extension}")[0] or "application/octet-stream", audio
+
+    def put(self, text: str, language: str, extension: str, audio: bytes) -> str | None:
+        """Store one clip and evict least recently used ones; return its token."""
+        if len(audio) > self._max_bytes:
+            _LOGGER.warning("Horoskop TTS clip (%d bytes) exceeds cache budget, not stored", len(audio))
+            return None
+        key = cache_key(text, language)
+        self._discard(key)
+        token = secrets.token_urlsafe(16)
+        self._entries[key] = (token, extension, audio)
+        self._tokens[token] = key
+        self._bytes += len(audio)
+        while len(self._entries) > self._max_entries or self._bytes > self._max_bytes:
+            self._discard(next(iter(self._entries)))
+        return token
+
+    def _discard(self, key: tuple[str, str]) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        token, _extension, audio = entry
+        self._tokens.pop(token, None)
+        self._bytes -= len(audio)
+
+    async def async_prerender(self, data: dict[str, Any], translated_language: str | None) -> None:
+        """Synthesize audio for texts that are not cached yet."""
+        async with self._lock:
+            for _slug, language, text in daily_texts(data, translated_language):
+                key = cache_key(text, language)
+                if key in self._entries:
+                    self._entries.move_to_end(key)
+                    continue
+                try:
+                    extension, audio = await self._synthesize(text, language)
+                except Exception as err:  # noqa: BLE001
+                    _LOGGER.warning("Horoskop TTS pre-render failed (%s): %s", language, err)
+                    continue
+                self.put(text, language, extension, audio)
@@ -0,0 +1,25 @@
+"""Constants shared by the Horoskop HR integration and headless core."""
+
+DEFAULT_MAX_PAGE_KB = 2048
+DEFAULT_PARSE_TIMEOUT = 5
+DEFAULT_FETCH_TIMEOUT = 30
+DEFAULT_CONCURRENCY = 4
+
+SOURCE_LANGUAGE = "hr"
+
+BASE_URL = "https://ehoroskop.net"
+
+SIGNS: dict[str, str] = {
+    "ovan": "Ovan",
+    "bik": "Bik",
+    "blizanci": "Blizanci",
+    "rak": "Rak",
+    "lav": "Lav",
+    "djevica": "Djevica",
+    "vaga": "Vaga",
+    "skorpion": "Skorpion",
+    "strijelac": "Strijelac",
+    "jarac": "Jarac",
+    "vodenjak": "Vodenjak",
+    "ribe": "Ribe",
+}
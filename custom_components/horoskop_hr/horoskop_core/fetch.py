@@ -0,0 +1,93 @@
+"""Blocking fetch and batch parse helpers for headless use."""
+from __future__ import annotations
+
+import os
+import urllib.request
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from functools import partial
+from pathlib import Path
+from typing import Any
+
+from .const import BASE_URL, DEFAULT_CONCURRENCY, DEFAULT_FETCH_TIMEOUT, DEFAULT_MAX_PAGE_KB, DEFAULT_PARSE_TIMEOUT, SIGNS
+from .parser import parse_page
+
+
+def fetch_page(url: str, max_bytes: int, timeout: float = DEFAULT_FETCH_TIMEOUT) -> tuple[bytes, str | None]:
+    """Download one page, rejecting anything larger than max_bytes."""
+    request = urllib.request.Request(url, headers={"User-Agent": "horoskop_hr"})
+    with urllib.request.urlopen(request, timeout=timeout) as response:  # noqa: S310
+        length = response.headers.get("Content-Length")
+        if length and length.isdigit() and int(length) > max_bytes:
+            raise RuntimeError(f"Page {url} exceeds {max_bytes} bytes.")
+        raw = response.read(max_bytes + 1)
+        if len(raw) > max_bytes:
+            raise RuntimeError(f"Page {url} exceeds {max_bytes} bytes.")
+        return raw, response.headers.get_content_charset()
+
+
+def fetch_sign(
+    slug: str,
+    max_page_kb: int = DEFAULT_MAX_PAGE_KB,
+    parse_timeout: float | None = DEFAULT_PARSE_TIMEOUT,
+    timeout: float = DEFAULT_FETCH_TIMEOUT,
+) -> dict[str, Any]:
+    """Fetch and parse one sign page."""
+    url = f"{BASE_URL}/{slug}/"
+    raw, charset = fetch_page(url, max_page_kb * 1024, timeout)
+    return {"slug": slug, "znak": SIGNS.get(slug, slug), "url": url, **parse_page(raw, charset, parse_timeout)}
+
+
+def fetch_signs(
+    slugs: Iterable[str],
+    concurrency: int = DEFAULT_CONCURRENCY,
+    **kwargs: Any,
+) -> Iterator[dict[str, Any]]:
+    """Fetch signs with at most `concurrency` requests in flight, yielding as they finish."""
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as pool:
+        futures = {pool.submit(fetch_sign, slug, **kwargs): slug for slug in slugs}
+        for future in as_completed(futures):
+            try:
+                yield future.result()
+            except Exception as err:  # noqa: BLE001
+                yield {"slug": futures[future], "error": str(err)}
+
+
+def parse_file(
+    path: str | os.PathLike[str],
+    parse_timeout: float | None = DEFAULT_PARSE_TIMEOUT,
+    max_page_kb: int = DEFAULT_MAX_PAGE_KB,
+) -> dict[str, Any]:
+    """Parse one saved sign page; the file stem is used as the sign slug."""
+    file_path = Path(path)
+    slug = file_path.stem
+    try:
+        max_bytes = max_page_kb * 1024
+        if file_path.stat().st_size > max_bytes:
+            raise RuntimeError(f"Page {file_path} exceeds {max_bytes} bytes.")
+        parsed = parse_page(file_path.read_bytes(), None, parse_timeout)
+    except Exception as err:  # noqa: BLE001
+        return {"slug": slug, "path": str(file_path), "error": str(err)}
+    return {"slug": slug, "znak": SIGNS.get(slug, slug), "path": str(file_path), **parsed}
+
+
+def parse_directory(
+    directory: str | os.PathLike[str],
+    workers: int | None = None,
+    parse_timeout: float | None = DEFAULT_PARSE_TIMEOUT,
+    pattern: str = "*.html",
+    max_page_kb: int = DEFAULT_MAX_PAGE_KB,
+) -> Iterator[dict[str, Any]]:
+    """Parse saved pages across worker processes, yielding results in file order."""
+    if not Path(directory).is_dir():
+        raise NotADirectoryError(f"Not a directory: {directory}")
+    paths = sorted(Path(directory).glob(pattern))
+    if not paths:
+        return
+    worker = partial(parse_file, parse_timeout=parse_timeout, max_page_kb=max_page_kb)
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        yield from map(worker, paths)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        yield from pool.map(worker, paths, chunksize=max(1, len(paths) // (workers * 4)))
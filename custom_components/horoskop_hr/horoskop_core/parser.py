@@ -0,0 +1,281 @@
+"""HTML decoding and parsing for ehoroskop.net sign pages.
+
+This module has no Home Assistant dependencies.
+"""
+from __future__ import annotations
+
+import html as html_lib
+import re
+import time
+from typing import Any
+
+
+def _try_demojibake(text: str) -> str:
+    """Best-effort recovery when UTF-8 was decoded with a legacy codepage."""
+    candidates = [text]
+    for src in ("latin-1", "cp1252", "cp1250"):
+        try:
+            candidates.append(text.encode(src).decode("utf-8"))
+        except Exception:  # noqa: BLE001
+            continue
+
+    def _score(value: str) -> int:
+        good = sum(value.count(ch) for ch in "čćžšđČĆŽŠĐ")
+        bad = value.count("Ã") + value.count("Ä") + value.count("Å") + value.count("Ĺ") + value.count("�")
+        return (good * 3) - (bad * 4)
+
+    return max(candidates, key=_score)
+
+
+def _normalize_match_text(text: str) -> str:
+    """Normalize text for tolerant section-title matching."""
+    value = _try_demojibake(_strip_tags(text)).lower()
+    value = value.replace("č", "c").replace("ć", "c").replace("ž", "z").replace("š", "s").replace("đ", "d")
+    value = re.sub(r"\s+", " ", value).strip()
+    return value
+
+
+# Parser patterns only match literals or character classes that stop at the
+# next tag boundary, so a scan never revisits input it has already consumed.
+_TAG_RE = re.compile(r"<[^<>]+>")
+_BR_RE = re.compile(r"<br\s*/?>", re.IGNORECASE)
+_H3_OPEN_RE = re.compile(r"<h3\b[^<>]*>", re.IGNORECASE)
+_H3_CLOSE_RE = re.compile(r"</h3\s*>", re.IGNORECASE)
+_DIV_OPEN_RE = re.compile(r"<div\b([^<>]*)>", re.IGNORECASE)
+_DIV_CLOSE_RE = re.compile(r"</div\s*>", re.IGNORECASE)
+_P_OPEN_RE = re.compile(r"<p\b[^<>]*>", re.IGNORECASE)
+_P_CLOSE_RE = re.compile(r"</p\s*>", re.IGNORECASE)
+_IMG_TAG_RE = re.compile(r"\s*<img\b([^<>]*)>", re.IGNORECASE)
+_SCORE_SRC_RE = re.compile(r"zvijezde-(\d{1,3})-5\.png", re.IGNORECASE)
+_WEEKLY_LABEL_RE = re.compile(r"(LJUBAV|KARIJERA|ZDRAVLJE(?:&SAVJET)?):", re.IGNORECASE)
+
+
+def _check_deadline(deadline: float | None) -> None:
+    """Abort parsing once the per-page time budget is spent."""
+    if deadline is not None and time.monotonic() > deadline:
+        raise RuntimeError("Page parse deadline exceeded.")
+
+
+def _strip_tags(text: str) -> str:
+    """Convert HTML to plain text with stable spacing."""
+    value = _BR_RE.sub("\n", text)
+    value = _TAG_RE.sub("", value)
+    value = html_lib.unescape(value)
+    lines = [re.sub(r"\s+", " ", line).strip() for line in value.splitlines()]
+    cleaned = "\n".join([line for line in lines if line]).strip()
+    repaired = _try_demojibake(cleaned)
+    # Drop residual C1 controls that sometimes appear in mojibake payloads.
+    repaired = re.sub(r"[\u0080-\u009f]", "", repaired)
+    return repaired
+
+
+def _attr_value(attrs: str, name: str) -> str | None:
+    """Return a double-quoted attribute value from a tag's attribute string."""
+    start = attrs.lower().find(f'{name}="')
+    if start == -1:
+        return None
+    start += len(name) + 2
+    end = attrs.find('"', start)
+    return attrs[start:end] if end != -1 else None
+
+
+def _iter_divs(chunk: str, class_name: str, deadline: float | None = None):
+    """Yield (inner_html, end) for each closed <div> whose class contains class_name."""
+    pos = 0
+    while True:
+        _check_deadline(deadline)
+        open_match = _DIV_OPEN_RE.search(chunk, pos)
+        if open_match is None:
+            return
+        pos = open_match.end()
+        if class_name not in (_attr_value(open_match.group(1), "class") or ""):
+            continue
+        close_match = _DIV_CLOSE_RE.search(chunk, pos)
+        if close_match is None:
+            return
+        yield chunk[pos : close_match.start()], close_match.end()
+        pos = close_match.end()
+
+
+def section_chunk(html: str, keyword: str, deadline: float | None = None) -> str | None:
+    """Return the HTML between the matching <h3> heading and the next one."""
+    wanted = _normalize_match_text(keyword)
+
+    def _title_matches(title_norm: str) -> bool:
+        if "mjesec" in wanted or "mjesec" in wanted or "mjese" in wanted:
+            return ("horoskop" in title_norm) and (
+                "mjesec" in title_norm or "mjesec" in title_norm or "mjese" in title_norm
+            )
+        if "tjedn" in wanted:
+            return ("horoskop" in title_norm) and ("tjedn" in title_norm)
+        if "dnevn" in wanted:
+            return ("horoskop" in title_norm) and ("dnevn" in title_norm)
+        return wanted in title_norm
+
+    pos = 0
+    while True:
+        _check_deadline(deadline)
+        open_match = _H3_OPEN_RE.search(html, pos)
+        if open_match is None:
+            return None
+        close_match = _H3_CLOSE_RE.search(html, open_match.end())
+        if close_match is None:
+            # No later heading can be closed either; stop instead of rescanning.
+            return None
+        pos = close_match.end()
+        if _title_matches(_normalize_match_text(html[open_match.end() : close_match.start()])):
+            break
+
+    next_h3 = _H3_OPEN_RE.search(html, pos)
+    return html[pos : next_h3.start()] if next_h3 else html[pos:]
+
+
+def extract_section(html: str, keyword: str, deadline: float | None = None) -> tuple[str | None, str]:
+    """Extract date and text payload for one section."""
+    chunk = section_chunk(html, keyword, deadline)
+    if chunk is None:
+        return None, ""
+
+    raw_date = None
+    for inner, _end in _iter_divs(chunk, "datum", deadline):
+        raw_date = _strip_tags(inner.strip())
+        break
+
+    raw_text = ""
+    p_open = _P_OPEN_RE.search(chunk)
+    if p_open:
+        p_close = _P_CLOSE_RE.search(chunk, p_open.end())
+        if p_close:
+            raw_text = _strip_tags(chunk[p_open.end() : p_close.start()])
+    return raw_date, raw_text
+
+
+# Real category labels are a word or two; longer ones are page noise.
+_MAX_CATEGORY_LABEL = 64
+
+
+def _category_key(normalized: str) -> str | None:
+    """Map an uppercased, space-free label to its category key."""
+    if "LJUBAV" in normalized:
+        return "ljubav"
+    if "KARIJERA" in normalized or "POSAO" in normalized:
+        return "posao"
+    if "ZDRAVLJE" in normalized:
+        return "zdravlje"
+    return None
+
+
+def _normalize_category(label: str) -> str | None:
+    return _category_key(_strip_tags(label).upper().replace("&", "").replace(" ", ""))
+
+
+def extract_weekly_scores(chunk: str, deadline: float | None = None) -> dict[str, int]:
+    """Extract weekly star scores from image URLs."""
+    scores: dict[str, int] = {}
+    for inner, end in _iter_divs(chunk, "zvijezda-text", deadline):
+        label = inner.strip()
+        if not label.endswith(":"):
+            continue
+        label = label[:-1]
+        if not label or ":" in label or len(label) > _MAX_CATEGORY_LABEL:
+            continue
+        img_match = _IMG_TAG_RE.match(chunk, end)
+        if img_match is None:
+            continue
+        score_match = _SCORE_SRC_RE.search(_attr_value(img_match.group(1), "src") or "")
+        if score_match is None:
+            continue
+        key = _normalize_category(label)
+        if not key:
+            continue
+        scores[key] = max(1, min(5, int(score_match.group(1))))
+    return scores
+
+
+def extract_weekly_split(text: str) -> dict[str, str]:
+    """Split weekly text into category paragraphs."""
+    sections: dict[str, str] = {}
+    labels = list(_WEEKLY_LABEL_RE.finditer(text))
+    for index, match in enumerate(labels):
+        end = labels[index + 1].start() if index + 1 < len(labels) else len(text)
+        # The label regex only matches plain words, so skip the tag/mojibake cleanup.
+        key = _category_key(match.group(1).upper().replace("&", ""))
+        if key:
+            sections[key] = re.sub(r"\s+", " ", text[match.end() : end]).strip()
+    return sections
+
+
+def format_daily(sign_name: str, payload: dict[str, Any]) -> str:
+    return f"{sign_name} ({payload.get('datum', '-')})\n{payload.get('tekst', '')}".strip()
+
+
+def format_weekly(sign_name: str, payload: dict[str, Any]) -> str:
+    categories = payload.get("kategorija", {})
+    parts = [f"{sign_name} ({payload.get('datum_od_do', '-')})"]
+    for key in ("ljubav", "posao", "zdravlje"):
+        entry = categories.get(key, {})
+        score = entry.get("score")
+        text = entry.get("tekst", "")
+        parts.append(f"{key.upper()} [{score if score is not None else '-'} / 5]: {text}")
+    return "\n".join(parts).strip()
+
+
+def format_monthly(sign_name: str, payload: dict[str, Any]) -> str:
+    return f"{sign_name} ({payload.get('mjesec', '-')})\n{payload.get('tekst', '')}".strip()
+
+
+def decode_html(raw: bytes, declared_charset: str | None) -> str:
+    """Decode HTML with robust fallback for Balkan encodings."""
+    # Some pages are served with misleading charset headers.
+    candidates = ["utf-8"]
+    if declared_charset and declared_charset.lower() != "utf-8":
+        candidates.append(declared_charset)
+    candidates.extend(["cp1250", "iso-8859-2", "latin-1"])
+
+    decoded: list[str] = []
+    for charset in candidates:
+        try:
+            decoded.append(raw.decode(charset))
+        except (LookupError, UnicodeDecodeError):
+            continue
+
+    if decoded:
+        def _score(text: str) -> int:
+            # Prefer strings with valid HR diacritics; penalize mojibake artifacts.
+            good = sum(text.count(ch) for ch in "čćžšđČĆŽŠĐ")
+            c1 = sum(1 for ch in text if 0x80 <= ord(ch) <= 0x9F)
+            bad = text.count("Ã") + text.count("Ä") + text.count("Å") + text.count("Ĺ") + text.count("�") + c1
+            return (good * 3) - (bad * 4)
+
+        return max(decoded, key=_score)
+
+    return raw.decode("utf-8", errors="replace")
+
+
+def parse_page(raw: bytes, declared_charset: str | None, parse_timeout: float | None = None) -> dict[str, Any]:
+    """Decode one sign page and extract daily, weekly and monthly sections."""
+    deadline = time.monotonic() + parse_timeout if parse_timeout else None
+    html = decode_html(raw, declared_charset)
+    _check_deadline(deadline)
+
+    daily_date, daily_text = extract_section(html, "Dnevni horoskop", deadline)
+    weekly_date, weekly_text = extract_section(html, "Tjedni horoskop", deadline)
+    monthly_date, monthly_text = extract_section(html, "Mjesečni horoskop", deadline)
+    if not monthly_text:
+        # Fallback for occasional unaccented heading variants.
+        monthly_date, monthly_text = extract_section(html, "Mjesecni horoskop", deadline)
+
+    weekly_chunk = section_chunk(html, "Tjedni horoskop", deadline) or ""
+    scores = extract_weekly_scores(weekly_chunk, deadline)
+    weekly_split = extract_weekly_split(weekly_text)
+    categories = {
+        "ljubav": {"score": scores.get("ljubav"), "tekst": weekly_split.get("ljubav", "")},
+        "posao": {"score": scores.get("posao"), "tekst": weekly_split.get("posao", "")},
+        "zdravlje": {"score": scores.get("zdravlje"), "tekst": weekly_split.get("zdravlje", "")},
+    }
+
+    return {
+        "dnevni": {"datum": daily_date, "tekst": daily_text},
+        "tjedni": {"datum_od_do": weekly_date, "kategorija": categories},
+        "mjesecni": {"mjesec": monthly_date, "tekst": monthly_text},
+    }
@@ -0,0 +1,88 @@
+"""Compact translation prompts built from raw horoscope payloads.
+
+This module has no Home Assistant dependencies.
+"""
+from __future__ import annotations
+
+import json
+import re
+from typing import Any
+
+from .const import SIGNS
+from .parser import format_daily, format_monthly, format_weekly
+
+_TOKEN_RE = re.compile(r"\w+|[^\w\s]")
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough LLM token estimate: one per word or punctuation mark."""
+    return sum(1 for _ in _TOKEN_RE.finditer(text))
+
+
+def build_translation_prompt(units: dict[str, str], language: str) -> str:
+    """Wrap translation units in a one-line instruction."""
+    return (
+        f"Translate the JSON values to language code '{language}'. "
+        "Reply with JSON only, same keys.\n"
+        f"{json.dumps(units, ensure_ascii=False, separators=(',', ':'))}"
+    )
+
+
+def translation_units(source: dict[str, Any]) -> dict[str, str]:
+    """Collect translatable prose from raw payloads under short stable IDs.
+
+    IDs are period letter + sign index (+ category letter for weekly), e.g.
+    ``d0``, ``t4l``, ``m11``. Names, dates, labels and scores stay local.
+    """
+    units: dict[str, str] = {}
+    dnevni = source.get("dnevni_raw") or {}
+    tjedni = source.get("tjedni_raw") or {}
+    mjesecni = source.get("mjesecni_raw") or {}
+    for index, slug in enumerate(SIGNS):
+        if text := (dnevni.get(slug) or {}).get("tekst"):
+            units[f"d{index}"] = text
+        categories = (tjedni.get(slug) or {}).get("kategorija") or {}
+        for key in ("ljubav", "posao", "zdravlje"):
+            if text := (categories.get(key) or {}).get("tekst"):
+                units[f"t{index}{key[0]}"] = text
+        if text := (mjesecni.get(slug) or {}).get("tekst"):
+            units[f"m{index}"] = text
+    return units
+
+
+def rebuild_translated(source: dict[str, Any], translations: Any) -> dict[str, dict[str, str]]:
+    """Rebuild formatted translated text from raw payloads plus translated units.
+
+    Signs with any missing unit are left out rather than mixing languages.
+    """
+    if not isinstance(translations, dict):
+        raise RuntimeError("Translation output is not a JSON object.")
+    units = translation_units(source)
+
+    def _lookup(unit_id: str) -> str | None:
+        if unit_id not in units:
+            return ""
+        value = translations.get(unit_id)
+        return value.strip() if isinstance(value, str) and value.strip() else None
+
+    out: dict[str, dict[str, str]] = {"dnevni": {}, "tjedni": {}, "mjesecni": {}}
+    for index, (slug, sign_name) in enumerate(SIGNS.items()):
+        daily = (source.get("dnevni_raw") or {}).get(slug)
+        if daily is not None and (text := _lookup(f"d{index}")) is not None:
+            out["dnevni"][slug] = format_daily(sign_name, {**daily, "tekst": text})
+
+        weekly = (source.get("tjedni_raw") or {}).get(slug)
+        if weekly is not None:
+            categories = dict(weekly.get("kategorija") or {})
+            for key in ("ljubav", "posao", "zdravlje"):
+                text = _lookup(f"t{index}{key[0]}")
+                if text is None:
+                    break
+                categories[key] = {**(categories.get(key) or {}), "tekst": text}
+            else:
+                out["tjedni"][slug] = format_weekly(sign_name, {**weekly, "kategorija": categories})
+
+        monthly = (source.get("mjesecni_raw") or {}).get(slug)
+        if monthly is not None and (text := _lookup(f"m{index}")) is not None:
+            out["mjesecni"][slug] = format_monthly(sign_name, {**monthly, "tekst": text})
+    return out
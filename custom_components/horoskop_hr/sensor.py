@@ -19,6 +19,7 @@ SENSOR_DEFS = [
     ("horoskop_dnevni_translated", "dnevni_translated", "mdi:translate"),
     ("horoskop_tjedni_translated", "tjedni_translated", "mdi:translate-variant"),
     ("horoskop_mjesecni_translated", "mjesecni_translated", "mdi:translate"),
+    ("horoskop_dnevni_tts", "dnevni_tts", "mdi:account-voice"),
 ]
 
 
@@ -0,0 +1,58 @@
+"""Pre-rendered TTS audio cache for Horoskop HR."""
+from __future__ import annotations
+
+from http import HTTPStatus
+
+from aiohttp import web
+from homeassistant.components import tts
+from homeassistant.components.http import HomeAssistantView
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+from .horoskop_core.audio_cache import AudioCache
+
+TTS_URL_PREFIX = f"/api/{DOMAIN}/tts"
+
+
+class HoroskopTtsCache(AudioCache):
+    """Bounded LRU store of audio synthesized by a Home Assistant TTS entity.
+
+    Audio bytes live only here, in memory; Home Assistant's own TTS cache is
+    bypassed, so evicting an entry frees its audio.
+    """
+
+    def __init__(self, hass: HomeAssistant, tts_entity: str | None, max_entries: int, max_bytes: int) -> None:
+        self.hass = hass
+        self._tts_entity = tts_entity
+        super().__init__(self._async_synthesize, max_entries, max_bytes, TTS_URL_PREFIX)
+
+    async def _async_synthesize(self, text: str, language: str) -> tuple[str, bytes]:
+        media_id = tts.generate_media_source_id(
+            self.hass,
+            text,
+            engine=self._tts_entity,
+            language=language,
+            cache=False,
+        )
+        return await tts.async_get_media_source_audio(self.hass, media_id)
+
+
+class HoroskopTtsView(HomeAssistantView):
+    """Serve pre-rendered audio to media players."""
+
+    url = TTS_URL_PREFIX + "/{filename}"
+    name = f"api:{DOMAIN}:tts"
+    # Media players fetch without HA credentials; URLs carry a random token.
+    requires_auth = False
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self.hass = hass
+
+    async def get(self, request: web.Request, filename: str) -> web.Response:
+        for data_coordinator, _ in self.hass.data.get(DOMAIN, {}).values():
+            cache = data_coordinator.tts_cache
+            found = cache.get_audio(filename) if cache else None
+            if found:
+                content_type, audio = found
+                return web.Response(body=audio, content_type=content_type)
+        return web.Response(status=HTTPStatus.NOT_FOUND)
@@ -0,0 +1,123 @@
+"""WebSocket API for Horoskop HR."""
+from __future__ import annotations
+
+from typing import Any
+
+import voluptuous as vol
+from homeassistant.components import websocket_api
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+
+from .const import DEFAULT_TRANSLATION_ENABLED, DOMAIN, PERIODS, SIGNAL_ENTRY_UNLOADED, SIGNS, SOURCE_LANGUAGE
+
+
+@callback
+def async_register_websocket_commands(hass: HomeAssistant) -> None:
+    """Register Horoskop HR websocket commands."""
+    websocket_api.async_register_command(hass, websocket_subscribe)
+
+
+def _sign_items(
+    data: dict[str, Any],
+    signs: list[str],
+    periods: list[str],
+    language: str,
+    translation_language: str,
+) -> dict[tuple[str, str], dict[str, Any]]:
+    """Build the per-sign view a subscriber asked for."""
+    items: dict[tuple[str, str], dict[str, Any]] = {}
+    for period in periods:
+        raw = data.get(f"{period}_raw") or {}
+        if language == SOURCE_LANGUAGE:
+            texts = data.get(f"{period}_formatted") or {}
+        elif language == translation_language:
+            texts = data.get(f"{period}_translated") or {}
+        else:
+            texts = {}
+        for slug in signs:
+            items[(slug, period)] = {"raw": raw.get(slug), "text": texts.get(slug)}
+    return items
+
+
+def _nest(items: dict[tuple[str, str], dict[str, Any]]) -> dict[str, dict[str, Any]]:
+    out: dict[str, dict[str, Any]] = {}
+    for (slug, period), item in items.items():
+        out.setdefault(slug, {})[period] = item
+    return out
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): f"{DOMAIN}/subscribe",
+        vol.Optional("entry_id"): str,
+        vol.Optional("signs"): [vol.In(list(SIGNS))],
+        vol.Optional("periods"): [vol.In(PERIODS)],
+        vol.Optional("language", default=SOURCE_LANGUAGE): str,
+    }
+)
+@callback
+def websocket_subscribe(hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]) -> None:
+    """Send a snapshot of the selected signs, then only the entries that change."""
+    entries = hass.data.get(DOMAIN, {})
+    entry_id = msg.get("entry_id")
+    if entry_id:
+        entry_data = entries.get(entry_id)
+    else:
+        entry_data = next(iter(entries.values())) if len(entries) == 1 else None
+    if not entry_data:
+        connection.send_error(msg["id"], websocket_api.ERR_NOT_FOUND, "No Horoskop HR entry found")
+        return
+
+    data_coordinator, _ = entry_data
+    signs = msg.get("signs") or list(SIGNS)
+    periods = msg.get("periods") or list(PERIODS)
+    language = msg["language"]
+    supported = [SOURCE_LANGUAGE]
+    if data_coordinator.entry.options.get("translation_enabled", DEFAULT_TRANSLATION_ENABLED):
+        supported.append(data_coordinator.translation_language())
+    if language not in supported:
+        connection.send_error(
+            msg["id"],
+            websocket_api.ERR_INVALID_FORMAT,
+            f"Unsupported language '{language}', expected one of: {', '.join(supported)}",
+        )
+        return
+
+    def _current() -> dict[tuple[str, str], dict[str, Any]]:
+        translation_language = data_coordinator.translation_language()
+        return _sign_items(data_coordinator.data or {}, signs, periods, language, translation_language)
+
+    sent = _current()
+
+    @callback
+    def _async_on_update() -> None:
+        nonlocal sent
+        current = _current()
+        changes = {key: item for key, item in current.items() if sent.get(key) != item}
+        if not changes:
+            return
+        sent = current
+        connection.send_message(websocket_api.event_message(msg["id"], {"changes": _nest(changes)}))
+
+    @callback
+    def _async_on_entry_unload() -> None:
+        # The coordinator is discarded on unload/reload; end the stream so the client resubscribes.
+        unsub = connection.subscriptions.pop(msg["id"], None)
+        if unsub is None:
+            return
+        unsub()
+        connection.send_message(websocket_api.event_message(msg["id"], {"unloaded": True}))
+
+    unsub_listener = data_coordinator.async_add_listener(_async_on_update)
+    unsub_unloaded = async_dispatcher_connect(
+        hass, SIGNAL_ENTRY_UNLOADED.format(data_coordinator.entry.entry_id), _async_on_entry_unload
+    )
+
+    @callback
+    def _async_unsubscribe() -> None:
+        unsub_listener()
+        unsub_unloaded()
+
+    connection.subscriptions[msg["id"]] = _async_unsubscribe
+    connection.send_result(msg["id"])
+    connection.send_message(websocket_api.event_message(msg["id"], {"snapshot": _nest(sent)}))
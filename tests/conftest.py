@@ -0,0 +1,7 @@
+"""Make the Home Assistant independent core importable without HA."""
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "custom_components" / "horoskop_hr"))
@@ -0,0 +1,109 @@
+"""AudioCache LRU, byte budget and token behaviour with a stand-in synthesizer."""
+from __future__ import annotations
+
+import asyncio
+
+from horoskop_core.audio_cache import AudioCache, cache_key, daily_texts
+
+PREFIX = "/api/horoskop_hr/tts"
+
+
+class FakeTts:
+    """Local stand-in for a TTS engine: returns `size` bytes of WAV per call."""
+
+    def __init__(self, size: int = 10, fail: set[str] | None = None) -> None:
+        self.size = size
+        self.fail = fail or set()
+        self.calls: list[tuple[str, str]] = []
+
+    async def __call__(self, text: str, language: str) -> tuple[str, bytes]:
+        self.calls.append((text, language))
+        if text in self.fail:
+            raise RuntimeError("engine down")
+        return "wav", text.encode()[:1] * self.size
+
+
+def _data(daily: dict[str, str], translated: dict[str, str] | None = None) -> dict:
+    return {"dnevni_formatted": daily, "dnevni_translated": translated}
+
+
+def _render(cache: AudioCache, data: dict, language: str | None = None) -> dict:
+    asyncio.run(cache.async_prerender(data, language))
+    return cache.lookup(data, language)
+
+
+def test_skips_texts_already_cached_by_hash_and_language() -> None:
+    tts = FakeTts()
+    cache = AudioCache(tts, max_entries=10, max_bytes=1000, url_prefix=PREFIX)
+    first = _render(cache, _data({"ovan": "A", "bik": "B"}, {"ovan": "A"}), "en")
+    second = _render(cache, _data({"ovan": "A", "bik": "B2"}, {"ovan": "A"}), "en")
+
+    assert tts.calls == [("A", "hr"), ("B", "hr"), ("A", "en"), ("B2", "hr")]
+    assert second["ovan"] == first["ovan"]
+    assert set(second["ovan"]) == {"hr", "en"}
+    assert second["ovan"]["hr"] != second["ovan"]["en"]
+    assert second["bik"]["hr"].startswith(f"{PREFIX}/") and second["bik"]["hr"].endswith(".wav")
+
+
+def test_evicts_least_recently_used_by_entry_count() -> None:
+    cache = AudioCache(FakeTts(), max_entries=2, max_bytes=1000, url_prefix=PREFIX)
+    urls = _render(cache, _data({"ovan": "A", "bik": "B"}))
+    cache.lookup(_data({"ovan": "A"}), None)  # touch A so B is oldest
+    asyncio.run(cache.async_prerender(_data({"rak": "C"}), None))
+
+    assert len(cache) == 2
+    assert cache.lookup(_data({"bik": "B"}), None) == {}
+    assert set(cache.lookup(_data({"ovan": "A", "rak": "C"}), None)) == {"ovan", "rak"}
+    assert cache.get_audio(urls["bik"]["hr"].rsplit("/", 1)[1]) is None
+
+
+def test_evicts_until_under_byte_budget() -> None:
+    cache = AudioCache(FakeTts(size=40), max_entries=100, max_bytes=100, url_prefix=PREFIX)
+    _render(cache, _data({"ovan": "A", "bik": "B", "rak": "C"}))
+
+    assert len(cache) == 2
+    assert cache.total_bytes == 80
+    assert set(cache.lookup(_data({"ovan": "A", "bik": "B", "rak": "C"}), None)) == {"bik", "rak"}
+
+
+def test_clip_larger_than_budget_is_not_stored() -> None:
+    cache = AudioCache(FakeTts(size=500), max_entries=10, max_bytes=100, url_prefix=PREFIX)
+    assert _render(cache, _data({"ovan": "A"})) == {}
+    assert len(cache) == 0 and cache.total_bytes == 0
+
+
+def test_evicted_token_is_not_served() -> None:
+    cache = AudioCache(FakeTts(), max_entries=1, max_bytes=1000, url_prefix=PREFIX)
+    filename = _render(cache, _data({"ovan": "A"}))["ovan"]["hr"].rsplit("/", 1)[1]
+    content_type, audio = cache.get_audio(filename)
+    assert content_type.startswith("audio/") and audio == b"A" * 10
+
+    _render(cache, _data({"bik": "B"}))
+    # HoroskopTtsView answers 404 when get_audio returns None.
+    assert cache.get_audio(filename) is None
+    assert len(cache._tokens) == 1
+
+
+def test_failed_synthesis_is_skipped_and_retried() -> None:
+    tts = FakeTts(fail={"B"})
+    cache = AudioCache(tts, max_entries=10, max_bytes=1000, url_prefix=PREFIX)
+    assert set(_render(cache, _data({"ovan": "A", "bik": "B"}))) == {"ovan"}
+    tts.fail.clear()
+    assert set(_render(cache, _data({"ovan": "A", "bik": "B"}))) == {"ovan", "bik"}
+    assert tts.calls.count(("B", "hr")) == 2
+
+
+def test_translation_into_source_language_does_not_shadow_source() -> None:
+    data = _data({"ovan": "Izvorni"}, {"ovan": "Prijevod"})
+    assert daily_texts(data, "hr") == [("ovan", "hr", "Izvorni")]
+
+    tts = FakeTts()
+    cache = AudioCache(tts, max_entries=10, max_bytes=1000, url_prefix=PREFIX)
+    _render(cache, data, "hr")
+    assert tts.calls == [("Izvorni", "hr")]
+
+
+def test_cache_key_depends_on_text_and_language() -> None:
+    assert cache_key("A", "hr") == cache_key("A", "hr")
+    assert cache_key("A", "hr") != cache_key("A", "en")
+    assert cache_key("A", "hr") != cache_key("B", "hr")
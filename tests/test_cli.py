@@ -0,0 +1,100 @@
+"""Headless CLI and batch helpers in horoskop_core."""
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from horoskop_core import fetch as fetch_module
+from horoskop_core.__main__ import main
+from horoskop_core.fetch import fetch_signs, parse_directory
+from test_parser_adversarial import PAGE
+
+
+@pytest.fixture
+def archive(tmp_path: Path) -> Path:
+    (tmp_path / "lav.html").write_text(PAGE, encoding="utf-8")
+    (tmp_path / "bik.html").write_bytes(PAGE.replace("Lav", "Bik").encode("cp1250"))
+    (tmp_path / "notes.txt").write_text("ignored", encoding="utf-8")
+    return tmp_path
+
+
+def _lines(capsys: pytest.CaptureFixture[str]) -> list[dict]:
+    return [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+
+
+@pytest.mark.parametrize("workers", ["1", "2"])
+def test_parse_emits_json_lines(archive: Path, capsys: pytest.CaptureFixture[str], workers: str) -> None:
+    assert main(["--formatted", "parse", str(archive), "--workers", workers]) == 0
+    records = _lines(capsys)
+    assert [record["slug"] for record in records] == ["bik", "lav"]
+    lav = records[1]
+    assert lav["znak"] == "Lav"
+    assert lav["dnevni"]["datum"] == "19.10.2026."
+    assert lav["tjedni"]["kategorija"]["ljubav"]["score"] == 4
+    assert lav["formatted"]["dnevni"].startswith("Lav (19.10.2026.)\nDanas ćete")
+    assert records[0]["tjedni"]["kategorija"]["posao"]["tekst"] == "Šef će primijetiti vaš trud."
+
+
+def test_parse_rejects_pages_over_limit(archive: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    (archive / "rak.html").write_text(PAGE + " " * 2048, encoding="utf-8")
+    assert main(["parse", str(archive), "--workers", "1", "--max-page-kb", "2"]) == 1
+    records = {record["slug"]: record for record in _lines(capsys)}
+    assert "exceeds 2048 bytes" in records["rak"]["error"]
+    assert "error" not in records["lav"]
+
+
+def test_parse_missing_directory_is_usage_error(tmp_path: Path) -> None:
+    with pytest.raises(SystemExit) as exc:
+        main(["parse", str(tmp_path / "missing")])
+    assert exc.value.code == 2
+    with pytest.raises(NotADirectoryError):
+        list(parse_directory(tmp_path / "missing"))
+
+
+def test_parse_empty_directory_warns(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    assert main(["parse", str(tmp_path)]) == 1
+    captured = capsys.readouterr()
+    assert captured.out == ""
+    assert "no records produced" in captured.err
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [
+        ["parse", ".", "--workers", "0"],
+        ["parse", ".", "--workers", "-1"],
+        ["parse", ".", "--max-page-kb", "0"],
+        ["fetch", "--concurrency", "0"],
+        ["fetch", "--signs", "xx"],
+    ],
+)
+def test_invalid_arguments_exit_2(argv: list[str]) -> None:
+    with pytest.raises(SystemExit) as exc:
+        main(argv)
+    assert exc.value.code == 2
+
+
+def test_fetch_signs_reports_errors_per_sign(monkeypatch: pytest.MonkeyPatch) -> None:
+    def fake_fetch_sign(slug: str, **_kwargs: object) -> dict:
+        if slug == "bik":
+            raise RuntimeError("HTTP 503")
+        return {"slug": slug, "znak": slug.title()}
+
+    monkeypatch.setattr(fetch_module, "fetch_sign", fake_fetch_sign)
+    records = sorted(fetch_signs(["ovan", "bik", "lav"], concurrency=2), key=lambda record: record["slug"])
+    assert records == [
+        {"slug": "bik", "error": "HTTP 503"},
+        {"slug": "lav", "znak": "Lav"},
+        {"slug": "ovan", "znak": "Ovan"},
+    ]
+
+
+def test_fetch_exit_code_reflects_errors(monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]) -> None:
+    def fake_fetch_sign(slug: str, **_kwargs: object) -> dict:
+        raise RuntimeError("offline")
+
+    monkeypatch.setattr(fetch_module, "fetch_sign", fake_fetch_sign)
+    assert main(["fetch", "--signs", "lav"]) == 1
+    assert _lines(capsys) == [{"slug": "lav", "error": "offline"}]
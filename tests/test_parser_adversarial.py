@@ -0,0 +1,150 @@
+"""Adversarial-input benchmark and legacy equivalence for horoskop_core.parser."""
+from __future__ import annotations
+
+import html as html_lib
+import re
+import time
+
+import pytest
+
+from horoskop_core.parser import _normalize_match_text, _try_demojibake, parse_page
+
+# Linear scans finish these in a few seconds; the old backtracking regexes
+# needed minutes to hours at the same sizes.
+MAX_SECONDS = 10.0
+
+PAGE = """<!DOCTYPE html>
+<html lang="hr"><head><meta charset="utf-8"><title>Lav - ehoroskop</title></head>
+<body>
+<div class="menu"><a href="/ovan/">Ovan</a> <a href="/lav/">Lav</a></div>
+<h3 class="naslov">Lav - Dnevni horoskop</h3>
+<div class="datum">
+  19.10.2026.
+</div>
+<p>Danas ćete osjetiti snažnu potrebu za promjenom.<br>Bližnji će vam &quot;pružiti&quot; podršku.</p>
+<h3 class="naslov">Lav - Tjedni horoskop</h3>
+<div class="datum">19.10.2026. - 25.10.2026.</div>
+<p>LJUBAV: Vikend donosi romantično iznenađenje. KARIJERA: Šef će primijetiti vaš trud.
+ZDRAVLJE&amp;SAVJET: Više šetajte i pijte vodu.</p>
+<div class="zvijezde"><div class="zvijezda-text">Ljubav:</div>
+<img class="z" src="/wp-content/uploads/zvijezde-4-5.png" alt="4/5">
+<div class="zvijezda-text">Karijera:</div> <img src="/wp-content/uploads/zvijezde-2-5.png">
+<div class="zvijezda-text">Zdravlje &amp; savjet:</div><img src="/wp-content/uploads/zvijezde-5-5.png"></div>
+<h3 class="naslov">Lav - Mjesečni horoskop</h3>
+<div class="mjesec datum">Listopad 2026.</div>
+<p>Mjesec pun izazova, ali i prilika za napredak u <b>poslu</b>.</p>
+<h3>Godišnji horoskop</h3><p>Ignorirano.</p>
+</body></html>
+"""
+
+
+def _legacy_strip_tags(text: str) -> str:
+    value = re.sub(r"(?i)<br\s*/?>", "\n", text)
+    value = re.sub(r"<[^>]+>", "", value)
+    value = html_lib.unescape(value)
+    lines = [re.sub(r"\s+", " ", line).strip() for line in value.splitlines()]
+    cleaned = "\n".join([line for line in lines if line]).strip()
+    return re.sub(r"[\u0080-\u009f]", "", _try_demojibake(cleaned))
+
+
+def _legacy_category(label: str) -> str | None:
+    normalized = _legacy_strip_tags(label).upper().replace("&", "").replace(" ", "")
+    if "LJUBAV" in normalized:
+        return "ljubav"
+    if "KARIJERA" in normalized or "POSAO" in normalized:
+        return "posao"
+    if "ZDRAVLJE" in normalized:
+        return "zdravlje"
+    return None
+
+
+def _legacy_section(html: str, period: str) -> tuple[str | None, str]:
+    for match in re.finditer(r"<h3[^>]*>(.*?)</h3>", html, re.IGNORECASE | re.DOTALL):
+        title = _normalize_match_text(match.group(1))
+        if "horoskop" in title and period in title:
+            break
+    else:
+        return None, ""
+    start = match.end()
+    next_h3 = re.search(r"<h3[^>]*>", html[start:], re.IGNORECASE)
+    chunk = html[start : start + next_h3.start()] if next_h3 else html[start:]
+    date_match = re.search(
+        r'<div[^>]*class="[^"]*datum[^"]*"[^>]*>\s*(.*?)\s*</div>', chunk, re.IGNORECASE | re.DOTALL
+    )
+    text_match = re.search(r"<p[^>]*>(.*?)</p>", chunk, re.IGNORECASE | re.DOTALL)
+    return (
+        _legacy_strip_tags(date_match.group(1)) if date_match else None,
+        _legacy_strip_tags(text_match.group(1)) if text_match else "",
+    )
+
+
+def _legacy_parse(html: str) -> dict:
+    """Baseline regex parser, kept as the reference output."""
+    daily_date, daily_text = _legacy_section(html, "dnevn")
+    weekly_date, weekly_text = _legacy_section(html, "tjedn")
+    monthly_date, monthly_text = _legacy_section(html, "mjese")
+
+    weekly_h3 = re.search(r"<h3[^>]*>.*?-\s*Tjedni horoskop\s*</h3>", html, re.IGNORECASE | re.DOTALL)
+    weekly_chunk = ""
+    if weekly_h3:
+        next_h3 = re.search(r"<h3[^>]*>", html[weekly_h3.end() :], re.IGNORECASE)
+        weekly_chunk = html[weekly_h3.end() : weekly_h3.end() + next_h3.start()] if next_h3 else html[weekly_h3.end() :]
+    scores = {}
+    for label, score in re.findall(
+        r'<div[^>]*class="[^"]*zvijezda-text[^"]*"[^>]*>\s*([^:]+):\s*</div>\s*'
+        r'<img[^>]+src="[^"]*zvijezde-(\d+)-5\.png"',
+        weekly_chunk,
+        re.IGNORECASE | re.DOTALL,
+    ):
+        if key := _legacy_category(label):
+            scores[key] = max(1, min(5, int(score)))
+    split = {}
+    for label, payload in re.findall(
+        r"(LJUBAV|KARIJERA|ZDRAVLJE(?:&SAVJET)?):\s*(.*?)(?=(?:LJUBAV|KARIJERA|ZDRAVLJE(?:&SAVJET)?):|$)",
+        weekly_text,
+        re.IGNORECASE | re.DOTALL,
+    ):
+        if key := _legacy_category(label):
+            split[key] = re.sub(r"\s+", " ", payload).strip()
+
+    return {
+        "dnevni": {"datum": daily_date, "tekst": daily_text},
+        "tjedni": {
+            "datum_od_do": weekly_date,
+            "kategorija": {
+                key: {"score": scores.get(key), "tekst": split.get(key, "")} for key in ("ljubav", "posao", "zdravlje")
+            },
+        },
+        "mjesecni": {"mjesec": monthly_date, "tekst": monthly_text},
+    }
+
+
+@pytest.mark.parametrize("encoding", ["utf-8", "cp1250"])
+def test_matches_legacy_regex_output(encoding: str) -> None:
+    parsed = parse_page(PAGE.encode(encoding), None)
+    assert parsed == _legacy_parse(PAGE)
+    assert parsed["tjedni"]["kategorija"]["posao"] == {"score": 2, "tekst": "Šef će primijetiti vaš trud."}
+
+
+ADVERSARIAL = {
+    "unclosed_h3": "<h3>" * 200_000,
+    "unclosed_h3_after_section": "<h3>Lav - Dnevni horoskop</h3><p>x</p>" + "<h3 class='a'>" * 200_000,
+    "two_mb_of_lt": "<" * 2_000_000,
+    "repeated_labels": "<h3>Lav - Tjedni horoskop</h3><p>" + "LJUBAV:" * 300_000 + "</p>",
+    "unclosed_divs": "<h3>Lav - Tjedni horoskop</h3>" + '<div class="zvijezda-text datum">' * 200_000,
+    "unclosed_paragraphs": "<h3>Lav - Dnevni horoskop</h3>" + "<p>" * 500_000,
+    "long_score_label": '<h3>Tjedni horoskop</h3><div class="zvijezda-text">' + "L" * 2_000_000 + ":</div><img src=",
+}
+
+
+@pytest.mark.parametrize("name", list(ADVERSARIAL))
+def test_adversarial_input_runtime_is_bounded(name: str) -> None:
+    raw = ADVERSARIAL[name].encode()
+    started = time.monotonic()
+    parse_page(raw, "utf-8", parse_timeout=None)
+    assert time.monotonic() - started < MAX_SECONDS
+
+
+def test_parse_deadline_aborts() -> None:
+    with pytest.raises(RuntimeError, match="deadline"):
+        parse_page(ADVERSARIAL["unclosed_divs"].encode(), "utf-8", parse_timeout=1e-9)
@@ -0,0 +1,160 @@
+"""Translation units, local rebuild and prompt size for horoskop_core.translation.
+
+Run directly (``python tests/test_translation.py``) to print the before/after
+prompt and response sizes for the shared fixture.
+"""
+from __future__ import annotations
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "custom_components" / "horoskop_hr"))
+
+from horoskop_core.const import SIGNS  # noqa: E402
+from horoskop_core.parser import format_daily, format_monthly, format_weekly  # noqa: E402
+from horoskop_core.translation import (  # noqa: E402
+    build_translation_prompt,
+    estimate_tokens,
+    rebuild_translated,
+    translation_units,
+)
+
+CATEGORIES = ("ljubav", "posao", "zdravlje")
+DAILY = "Danas ćete osjetiti snažnu potrebu za promjenom u odnosima s bližnjima. " * 5
+WEEKLY = "Tjedan donosi nove izazove, ali i prilike za napredak u poslu. " * 3
+MONTHLY = "Mjesec je pun iznenađenja; iskoristite energiju za planove koje odgađate. " * 10
+
+
+def make_source(daily: str = DAILY, weekly: str = WEEKLY, monthly: str = MONTHLY) -> dict:
+    """Realistic 12-sign payload shaped like HoroskopDataCoordinator data."""
+    source: dict = {key: {} for key in ("dnevni_raw", "tjedni_raw", "mjesecni_raw")}
+    for slug, name in SIGNS.items():
+        url = f"https://ehoroskop.net/{slug}/"
+        source["dnevni_raw"][slug] = {"znak": name, "url": url, "datum": "19.10.2026.", "tekst": daily.strip()}
+        source["tjedni_raw"][slug] = {
+            "znak": name,
+            "url": url,
+            "datum_od_do": "19.10.2026. - 25.10.2026.",
+            "kategorija": {key: {"score": 3, "tekst": weekly.strip()} for key in CATEGORIES},
+        }
+        source["mjesecni_raw"][slug] = {"znak": name, "url": url, "mjesec": "Listopad 2026.", "tekst": monthly.strip()}
+    for period, formatter in (("dnevni", format_daily), ("tjedni", format_weekly), ("mjesecni", format_monthly)):
+        source[f"{period}_formatted"] = {
+            slug: formatter(SIGNS[slug], payload) for slug, payload in source[f"{period}_raw"].items()
+        }
+    return source
+
+
+def legacy_prompt(source: dict, language: str) -> tuple[str, str]:
+    """Prompt and ideal response of the formatted-text translation used before."""
+    compact_source = {period: source[f"{period}_formatted"] for period in ("dnevni", "tjedni", "mjesecni")}
+    payload = json.dumps(compact_source, ensure_ascii=False)
+    prompt = (
+        f"Translate the following horoscope texts to language code '{language}'.\n"
+        "Return strictly valid JSON only. Keep original keys and structure exactly:\n"
+        "{'dnevni': {'slug': 'text'}, 'tjedni': {'slug': 'text'}, 'mjesecni': {'slug': 'text'}}.\n"
+        "Do not add markdown, comments, or extra keys.\n\n"
+        f"INPUT_JSON:\n{payload}"
+    )
+    return prompt, payload
+
+
+def size_report(language: str = "en") -> dict[str, tuple[int, int]]:
+    """(before, after) chars and estimated tokens for prompt and response."""
+    source = make_source()
+    old_prompt, old_response = legacy_prompt(source, language)
+    units = translation_units(source)
+    new_prompt = build_translation_prompt(units, language)
+    new_response = json.dumps(units, ensure_ascii=False, separators=(",", ":"))
+    return {
+        "prompt_chars": (len(old_prompt), len(new_prompt)),
+        "prompt_tokens": (estimate_tokens(old_prompt), estimate_tokens(new_prompt)),
+        "response_chars": (len(old_response), len(new_response)),
+        "response_tokens": (estimate_tokens(old_response), estimate_tokens(new_response)),
+    }
+
+
+def test_unit_ids_are_short_and_stable() -> None:
+    units = translation_units(make_source())
+    assert len(units) == 12 * 5
+    assert units["d0"] == DAILY.strip()
+    assert units["t4l"] == units["t4p"] == units["t4z"] == WEEKLY.strip()
+    assert units["m11"] == MONTHLY.strip()
+    # Sign order follows SIGNS, so IDs never depend on fetch completion order.
+    assert list(units)[:5] == ["d0", "t0l", "t0p", "t0z", "m0"]
+    assert not any(name in " ".join(units) for name in ("19.10.2026.", "LJUBAV", "/ 5]"))
+
+
+def test_identity_translation_rebuilds_formatted_text() -> None:
+    source = make_source()
+    rebuilt = rebuild_translated(source, translation_units(source))
+    for period in ("dnevni", "tjedni", "mjesecni"):
+        assert rebuilt[period] == source[f"{period}_formatted"]
+
+
+def test_translated_text_keeps_local_structure() -> None:
+    source = make_source()
+    reply = {unit_id: f"EN {unit_id}" for unit_id in translation_units(source)}
+    rebuilt = rebuild_translated(source, reply)
+    assert rebuilt["dnevni"]["ovan"] == "Ovan (19.10.2026.)\nEN d0"
+    assert rebuilt["tjedni"]["bik"] == (
+        "Bik (19.10.2026. - 25.10.2026.)\nLJUBAV [3 / 5]: EN t1l\nPOSAO [3 / 5]: EN t1p\nZDRAVLJE [3 / 5]: EN t1z"
+    )
+    assert rebuilt["mjesecni"]["ribe"] == "Ribe (Listopad 2026.)\nEN m11"
+
+
+@pytest.mark.parametrize(
+    ("drop", "period", "slug"),
+    [
+        ("d2", "dnevni", "blizanci"),
+        ("t3p", "tjedni", "rak"),
+        ("t3z", "tjedni", "rak"),
+        ("m5", "mjesecni", "djevica"),
+    ],
+)
+def test_missing_unit_drops_only_that_sign(drop: str, period: str, slug: str) -> None:
+    source = make_source()
+    reply = {unit_id: text for unit_id, text in translation_units(source).items() if unit_id != drop}
+    rebuilt = rebuild_translated(source, reply)
+    assert slug not in rebuilt[period]
+    assert len(rebuilt[period]) == 11
+    for other in {"dnevni", "tjedni", "mjesecni"} - {period}:
+        assert len(rebuilt[other]) == 12
+
+
+@pytest.mark.parametrize("bad_value", [None, 42, ["text"], {"text": "x"}, "", "   "])
+def test_non_string_or_blank_unit_counts_as_missing(bad_value: object) -> None:
+    source = make_source()
+    reply = {**translation_units(source), "d0": bad_value}
+    rebuilt = rebuild_translated(source, reply)
+    assert "ovan" not in rebuilt["dnevni"]
+    assert len(rebuilt["dnevni"]) == 11
+
+
+def test_empty_source_text_is_not_sent_and_rebuilds_empty() -> None:
+    source = make_source(weekly="")
+    units = translation_units(source)
+    assert not any(unit_id.startswith("t") for unit_id in units)
+    rebuilt = rebuild_translated(source, units)
+    assert rebuilt["tjedni"]["lav"] == source["tjedni_formatted"]["lav"]
+    assert len(rebuilt["tjedni"]) == 12
+
+
+@pytest.mark.parametrize("reply", [["d0", "text"], "text", None, 3])
+def test_non_object_reply_raises_clear_error(reply: object) -> None:
+    with pytest.raises(RuntimeError, match="not a JSON object"):
+        rebuild_translated(make_source(), reply)
+
+
+def test_compact_prompt_is_smaller_than_formatted_prompt() -> None:
+    report = size_report()
+    for before, after in report.values():
+        assert after < before
+
+
+if __name__ == "__main__":
+    for metric, (before, after) in size_report().items():
+        print(f"{metric:16} {before:7d} -> {after:7d} ({(after - before) / before:+.1%})")